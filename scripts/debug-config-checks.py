@@ -22,10 +22,12 @@ print(" ", tidysdmx.__file__)
 
 print(" tidysdmx is package:", hasattr(tidysdmx, "__path__"))
 
-if hasattr(tidysdmx, "__path__"):
+# Listing the package directory is only useful when chasing import issues;
+# set TIDYSDMX_DEBUG=1 to enable it.
+if os.environ.get("TIDYSDMX_DEBUG") and hasattr(tidysdmx, "__path__"):
     print("\nFiles in tidysdmx package directory:")
     for pkg_path in tidysdmx.__path__:
-        for name in os.listdir(pkg_path):
-            print(" ", name)
+        with os.scandir(pkg_path) as entries:
+            print("\n".join(f"  {entry.name}" for entry in entries))
 
 print("\n=========================\n")
@@ -1,4 +1,5 @@
 from typing import Dict, List, Tuple, Any
+import numpy as np
 import pandas as pd
 import pysdmx as px
 from typeguard import typechecked
@@ -21,54 +22,62 @@ def map_structures(
     Returns:
         pd.DataFrame: Modified DataFrame with all mappings applied.
     """
+    # Copy once here; the apply_* stages below then work in place on this copy.
     result_df = df.copy()
 
-    # Separate maps by type
-    fixed_value_maps = []
-    implicit_maps = []
-    component_maps = []
-    multi_component_maps = []
+    # Separate maps by type with one dict lookup per map. Insertion order is
+    # also the isinstance() fallback order for subclasses.
+    buckets: Dict[type, list] = {
+        px.model.map.FixedValueMap: [],
+        px.model.map.ImplicitComponentMap: [],
+        px.model.map.ComponentMap: [],
+        px.model.map.MultiComponentMap: [],
+    }
 
     for m in structure_map.maps:
-        if isinstance(m, px.model.map.FixedValueMap):
-            fixed_value_maps.append(m)
-        elif isinstance(m, px.model.map.ImplicitComponentMap):
-            implicit_maps.append(m)
-        elif isinstance(m, px.model.map.ComponentMap):
-            component_maps.append(m)
-        elif isinstance(m, px.model.map.MultiComponentMap):
-            multi_component_maps.append(m)
-        else:
-            raise TypeError(f"Unknown map type: {type(m)}")
+        bucket = buckets.get(type(m))
+        if bucket is None:
+            bucket = next((b for cls, b in buckets.items() if isinstance(m, cls)), None)
+            if bucket is None:
+                raise TypeError(f"Unknown map type: {type(m)}")
+        bucket.append(m)
+
+    fixed_value_maps = buckets[px.model.map.FixedValueMap]
+    implicit_maps = buckets[px.model.map.ImplicitComponentMap]
+    component_maps = buckets[px.model.map.ComponentMap]
+    multi_component_maps = buckets[px.model.map.MultiComponentMap]
 
     # Apply each type of map
     if fixed_value_maps:
-        result_df = apply_fixed_value_maps(result_df, fixed_value_maps)
+        result_df = apply_fixed_value_maps(result_df, fixed_value_maps, copy=False)
         if verbose:
             print(f"✅ Applied {len(fixed_value_maps)} FixedValueMap(s).")
 
     if implicit_maps:
         result_df = apply_implicit_component_maps(result_df, implicit_maps, 
-                                                  verbose=verbose)
+                                                  verbose=verbose, copy=False)
 
     for cmap in component_maps:
-        result_df = apply_component_map(result_df, cmap, verbose=verbose)
+        result_df = apply_component_map(result_df, cmap, verbose=verbose, copy=False)
 
     for mcm in multi_component_maps:
-        result_df = apply_multi_component_map(result_df, mcm, verbose=verbose)
+        result_df = apply_multi_component_map(result_df, mcm, verbose=verbose, copy=False)
 
     return result_df
 
 @typechecked
 def apply_fixed_value_maps(
     df: pd.DataFrame, 
-    fixed_value_maps: List[px.model.map.FixedValueMap]
+    fixed_value_maps: List[px.model.map.FixedValueMap],
+    copy: bool = True,
 ) -> pd.DataFrame:
     """Apply FixedValueMap rules to a DataFrame.
 
     Args:
         df (pd.DataFrame): The source dataset.
         fixed_value_maps (List[FixedValueMap]): A list of FixedValueMap objects containing target and value.
+        copy (bool, optional): If True (default), work on a copy of df. If False, columns
+            are added to df in place, avoiding a full copy when chaining mapping steps.
 
     Returns:
         pd.DataFrame: Modified DataFrame with fixed value columns added.
@@ -85,7 +94,7 @@ def apply_fixed_value_maps(
         )
 
     # Work on a copy to avoid mutating the original DataFrame
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
 
     for fmap in fixed_value_maps:
         # Each FixedValueMap has attributes: target (column name), value (fixed value)
@@ -98,6 +107,7 @@ def apply_implicit_component_maps(
     df: pd.DataFrame,
     implicit_maps: List[px.model.map.ImplicitComponentMap],
     verbose: bool = False,
+    copy: bool = True,
 ) -> pd.DataFrame:
     """Apply ImplicitComponentMap rules to a DataFrame, supporting different source/target names.
 
@@ -105,6 +115,8 @@ def apply_implicit_component_maps(
         df (pd.DataFrame): The source dataset.
         implicit_maps (List[ImplicitComponentMap]): A list of ImplicitComponentMap objects containing source and target.
         verbose (bool, optional): If True, print logs about applied mappings and conflicts.
+        copy (bool, optional): If True (default), work on a copy of df. If False, columns
+            are added to df in place, avoiding a full copy when chaining mapping steps.
 
     Returns:
         pd.DataFrame: Modified DataFrame with implicit component mappings applied.
@@ -118,7 +130,9 @@ def apply_implicit_component_maps(
             "All elements in implicit_maps must be ImplicitComponentMap instances."
         )
 
-    result_df = df.copy()
+    # Record the original columns before any in-place changes (for verbose logging)
+    original_columns = set(df.columns) if verbose else set()
+    result_df = df.copy() if copy else df
 
     for imap in implicit_maps:
         source_col = imap.source
@@ -133,7 +147,7 @@ def apply_implicit_component_maps(
         # Copy values from source to target
         result_df[target_col] = result_df[source_col]
         if verbose:
-            action = "Overwritten" if target_col in df.columns else "Added"
+            action = "Overwritten" if target_col in original_columns else "Added"
             print(f"✅ {action} column '{target_col}' from source '{source_col}'.")
 
     return result_df
@@ -142,7 +156,8 @@ def apply_implicit_component_maps(
 def apply_component_map(
     df: pd.DataFrame, 
     component_map: px.model.map.ComponentMap, 
-    verbose: bool = False
+    verbose: bool = False,
+    copy: bool = True,
 ) -> pd.DataFrame:
     """Apply a single ComponentMap with a RepresentationMap to a DataFrame.
 
@@ -150,6 +165,8 @@ def apply_component_map(
         df (pd.DataFrame): Source data.
         component_map (ComponentMap): ComponentMap object with source, target, and values (RepresentationMap).
         verbose (bool, optional): If True, print progress.
+        copy (bool, optional): If True (default), work on a copy of df. If False, the
+            target column is written to df in place.
 
     Returns:
         pd.DataFrame: DataFrame with the target column added or overwritten.
@@ -160,7 +177,7 @@ def apply_component_map(
         raise TypeError("component_maps must be ComponentMap object.")
 
     # Copy to avoid mutating original
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
 
     source_col = component_map.source
     target_col = component_map.target
@@ -189,6 +206,7 @@ def apply_multi_component_map(
     df: pd.DataFrame,
     multi_component_map: px.model.map.MultiComponentMap,
     verbose: bool = False,
+    copy: bool = True,
 ) -> pd.DataFrame:
     """Apply a single MultiComponentMap with regex support, preserving rule order.
 
@@ -199,11 +217,13 @@ def apply_multi_component_map(
         df (pd.DataFrame): Source data.
         multi_component_map (MultiComponentMap): MultiComponentMap object with source columns, target column, and values (MultiRepresentationMap).
         verbose (bool, optional): If True, print progress.
+        copy (bool, optional): If True (default), work on a copy of df. If False, the
+            target column is written to df in place.
 
     Returns:
         pd.DataFrame: DataFrame with the target column added or overwritten.
     """
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
 
     source_cols = multi_component_map.source
     target_col = multi_component_map.target[0]  # Assuming one target column
@@ -214,35 +234,34 @@ def apply_multi_component_map(
     if missing_cols:
         raise KeyError(f"Missing source columns: {missing_cols}")
 
-    # Prepare ordered rules (preserve original order)
+    # Prepare ordered rules (preserve original order). Regex patterns are
+    # compiled once here, and identical patterns share one compiled object.
+    compiled: Dict[str, re.Pattern] = {}
     rules = []
     for mv in rep_map.maps:
+        patterns = []
+        for pattern in mv.source:  # list of patterns or exact values
+            if pattern.startswith("regex:"):
+                regex = pattern.replace("regex:", "")
+                if regex not in compiled:
+                    compiled[regex] = re.compile(regex)
+                pattern = compiled[regex]
+            patterns.append(pattern)
         rules.append(
             {
-                "patterns": mv.source,  # list of patterns or exact values
+                "patterns": patterns,
                 "target": mv.target[0],
             }
         )
 
-    # Apply mapping row-wise with regex support
-    def match_row(row):
-        for rule in rules:  # Apply in order
-            match = True
-            for col_val, pattern in zip(row, rule["patterns"]):
-                if pattern.startswith("regex:"):
-                    regex = pattern.replace("regex:", "")
-                    if not re.fullmatch(regex, str(col_val)):
-                        match = False
-                        break
-                else:
-                    if col_val != pattern:
-                        match = False
-                        break
-            if match:
-                return rule["target"]  # First match wins
-        return None  # No match found
-
-    result_df[target_col] = result_df[source_cols].apply(match_row, axis=1)
+    # Source columns are usually low-cardinality, so run the rules once per
+    # distinct source tuple and broadcast the result back to every row.
+    source_values = [result_df[col].to_numpy(dtype=object) for col in source_cols]
+    row_codes, first_rows = _factorize_rows(source_values, len(result_df))
+    unique_values = [values[first_rows] for values in source_values]
+    mapped = _match_multi_rules(unique_values, rules, len(first_rows))[row_codes]
+
+    result_df[target_col] = mapped
 
     if verbose:
         print(
@@ -254,4 +273,93 @@ def apply_multi_component_map(
 
     return result_df
 
+def _factorize_column(values: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Factorize an object column so that equal codes behave identically in rule matching.
+
+    pd.factorize treats None/NaN and 1/1.0/True as equal, but these stringify
+    differently for regex rules. Missing values therefore get codes by their
+    string form, and columns mixing value types are keyed on (type, str).
+
+    Args:
+        values (np.ndarray): Object array of column values.
+
+    Returns:
+        Tuple[np.ndarray, int]: Integer codes per row and the number of distinct codes.
+    """
+    codes, uniques = pd.factorize(values)
+    # Only mixed columns can have distinct values merged by factorize; the
+    # inferred type of the uniques alone would hide e.g. 1 absorbed by True.
+    if pd.api.types.infer_dtype(uniques, skipna=False) not in ("string", "empty") and \
+            pd.api.types.infer_dtype(values, skipna=True).startswith("mixed"):
+        keys = pd.Series([(type(v), str(v)) for v in values], dtype=object)
+        codes, uniques = pd.factorize(keys)
+        return codes, len(uniques)
+
+    missing = codes < 0
+    if not missing.any():
+        return codes, len(uniques)
+    na_codes, na_uniques = pd.factorize(np.array([str(v) for v in values[missing]], dtype=object))
+    codes[missing] = len(uniques) + na_codes
+    return codes, len(uniques) + len(na_uniques)
+
+
+def _factorize_rows(source_values: List[np.ndarray], n_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Assign each row a code identifying its tuple of source values.
+
+    Args:
+        source_values (List[np.ndarray]): One object array per source column.
+        n_rows (int): Number of rows, used when there are no source columns.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Consecutive codes per row, and the position
+            of the first row for each code.
+    """
+    row_codes = np.zeros(n_rows, dtype=np.int64)
+    for values in source_values:
+        codes, n_codes = _factorize_column(values)
+        # Refactorize after each combination so the key stays below n_rows
+        row_codes, _ = pd.factorize(row_codes * n_codes + codes)
+    _, first_rows = np.unique(row_codes, return_index=True)
+    return row_codes, first_rows
+
+
+def _match_multi_rules(source_values: List[np.ndarray], rules: List[Dict[str, Any]], n_rows: int) -> np.ndarray:
+    """Evaluate ordered multi-component rules, first match wins.
+
+    Args:
+        source_values (List[np.ndarray]): One object array per source column.
+        rules (List[Dict[str, Any]]): Rules with "patterns" (literal values or
+            compiled regexes) and "target".
+        n_rows (int): Number of rows to evaluate.
+
+    Returns:
+        np.ndarray: Object array with the matched target per row, None if unmatched.
+    """
+    mapped = np.full(n_rows, None, dtype=object)
+    unmatched = np.ones(n_rows, dtype=bool)
+
+    for rule in rules:  # Apply in order
+        if not unmatched.any():
+            break
+        rule_mask = unmatched.copy()
+        regex_checks = []
+        # zip truncates to the shorter of source columns and patterns
+        for values, pattern in zip(source_values, rule["patterns"]):
+            if isinstance(pattern, re.Pattern):
+                regex_checks.append((values, pattern))
+            else:
+                rule_mask &= values == pattern
+        # Regexes run last, and only on rows still unclaimed that passed the
+        # literal checks, so earlier rules shrink the regex workload.
+        for values, pattern in regex_checks:
+            candidates = np.flatnonzero(rule_mask)
+            if candidates.size == 0:
+                break
+            rule_mask[candidates] = [pattern.fullmatch(str(v)) is not None for v in values[candidates]]
+        # First match wins: only rows not claimed by an earlier rule are assigned
+        mapped[rule_mask] = rule["target"]
+        unmatched &= ~rule_mask
+
+    return mapped
+
 # endregion
\ No newline at end of file
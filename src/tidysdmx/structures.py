@@ -1,8 +1,8 @@
 from typeguard import typechecked
 from dataclasses import dataclass
 from typing import List, Tuple, Union, Optional, Literal, Sequence, Any, Dict
-from itertools import combinations
 from datetime import datetime, timezone
+from functools import lru_cache
 from pysdmx.model.dataflow import Schema, Components, Component
 from pysdmx.model import Concept, Role, DataType, Codelist, Code
 from openpyxl import Workbook, load_workbook
@@ -19,6 +19,7 @@ from pysdmx.model.map import (
     ComponentMap,
     StructureMap
     )
+import numpy as np
 import pandas as pd
 import re
 # Import tidysdmx functions
@@ -148,7 +149,6 @@ def build_date_pattern_map(
     )
 
 
-typechecked
 def build_value_map(
     source: str,
     target: str,
@@ -194,6 +194,67 @@ def build_value_map(
 # endregion
 
 # region representation maps
+def _all_strings(series: pd.Series, allow_missing: bool = False) -> bool:
+    """Check that every value in a Series is a string, using pandas' C-level type inference.
+
+    Equivalent to ``series.map(lambda x: isinstance(x, str)).all()`` (or, with
+    ``allow_missing=True``, the same check on ``series.dropna()``) without a
+    Python call per cell.
+
+    Args:
+        series (pd.Series): The column to check.
+        allow_missing (bool): Whether missing values (None/NaN/NA) are accepted.
+            Defaults to False.
+
+    Returns:
+        bool: True if all (non-missing) values are strings.
+    """
+    if series.hasnans:
+        if not allow_missing:
+            return False
+        series = series.dropna()
+        if series.empty:
+            return True
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Only the categories actually in use matter
+        series = series.cat.categories[series.cat.codes.unique()]
+    return pd.api.types.infer_dtype(series, skipna=False) in ("string", "empty")
+
+
+def _optional_column_values(df: pd.DataFrame, col: str) -> list:
+    """Return ``df[col]`` as a list with missing values as None (all None if the column is absent)."""
+    if col not in df.columns:
+        return [None] * len(df)
+    values = df[col].astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+def _to_validity_datetime(value: Any) -> Optional[datetime]:
+    """Convert a validity value (ISO string, Timestamp or datetime) to a datetime, else None."""
+    # Handle pandas Timestamp or string format
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if hasattr(value, "to_pydatetime"):
+        return value.to_pydatetime()
+    if isinstance(value, datetime):
+        return value
+    return None
+
+
+def _validity_datetimes(df: pd.DataFrame, col: str) -> list[Optional[datetime]]:
+    """Return ``df[col]`` converted to datetimes, parsing each distinct value only once.
+
+    Validity dates are highly repetitive in mapping tables, so conversions are
+    memoised per distinct value. Missing values and an absent column yield None.
+    """
+    values = _optional_column_values(df, col)
+    converted: dict[Any, Optional[datetime]] = {None: None}
+    for value in values:
+        if value not in converted:
+            converted[value] = _to_validity_datetime(value)
+    return [converted[value] for value in values]
+
+
 @typechecked
 def build_value_map_list(
     df: pd.DataFrame,
@@ -239,23 +300,26 @@ def build_value_map_list(
         raise ValueError("Input DataFrame cannot be empty.")
     if source_col not in df.columns or target_col not in df.columns:
         raise ValueError(f"Columns '{source_col}' and '{target_col}' must exist in DataFrame.")
-    if not df[source_col].map(lambda x: isinstance(x, str)).all() or \
-       not df[target_col].map(lambda x: isinstance(x, str)).all():
+    if not _all_strings(df[source_col]) or not _all_strings(df[target_col]):
         raise TypeError("Source and target columns must contain only string values.")
 
-    has_valid_from = valid_from_col in df.columns
-    has_valid_to = valid_to_col in df.columns
+    # Pull each column out once and walk them in lockstep; iterrows would
+    # build a Series for every row.
+    sources = df[source_col].tolist()
+    targets = df[target_col].tolist()
+    valid_froms = _optional_column_values(df, valid_from_col)
+    valid_tos = _optional_column_values(df, valid_to_col)
 
     value_maps: list[ValueMap] = []
-    for _, row in df.iterrows():
+    for source, target, valid_from, valid_to in zip(sources, targets, valid_froms, valid_tos):
         kwargs = {
-            "source": row[source_col],
-            "target": row[target_col]
+            "source": source,
+            "target": target
         }
-        if has_valid_from and pd.notna(row.get(valid_from_col)):
-            kwargs["valid_from"] = str(row[valid_from_col])
-        if has_valid_to and pd.notna(row.get(valid_to_col)):
-            kwargs["valid_to"] = str(row[valid_to_col])
+        if valid_from is not None:
+            kwargs["valid_from"] = str(valid_from)
+        if valid_to is not None:
+            kwargs["valid_to"] = str(valid_to)
         value_maps.append(ValueMap(**kwargs))
 
     return value_maps
@@ -326,51 +390,37 @@ def build_multi_value_map_list(
     # 2. Validate Data Types (Must be strings for SDMX mappings)
     for col in source_cols:
         # Check if any value in the column is NOT a string
-        if not df[col].apply(lambda x: isinstance(x, str)).all():
+        if not _all_strings(df[col]):
             raise TypeError(f"Source column '{col}' must contain only string values.")
 
     for col in target_cols:
-        if not df[col].apply(lambda x: isinstance(x, str)).all():
+        if not _all_strings(df[col]):
             raise TypeError(f"Target column '{col}' must contain only string values.")
 
-    has_valid_from = valid_from_col in df.columns
-    has_valid_to = valid_to_col in df.columns
-
     multi_value_maps: list[MultiValueMap] = []
 
-    # 3. Iterate and Build
-    for _, row in df.iterrows():
-        # Correctly extract source AND target using their respective lists
-        source_values = [row[col] for col in source_cols]
-        target_values = [row[col] for col in target_cols]
+    # 3. Extract the source and target blocks as 2-D arrays in one pass each;
+    # tolist() then yields one list of values per row directly.
+    source_rows = df[list(source_cols)].to_numpy(dtype=object).tolist()
+    target_rows = df[list(target_cols)].to_numpy(dtype=object).tolist()
+    valid_froms = _validity_datetimes(df, valid_from_col)
+    valid_tos = _validity_datetimes(df, valid_to_col)
 
+    # 4. Iterate and Build
+    for source_values, target_values, valid_from, valid_to in zip(
+        source_rows, target_rows, valid_froms, valid_tos
+    ):
         # MultiValueMap expects sequences for source/target, keyword-only args
         kwargs = {
             "source": source_values,
             "target": target_values,
         }
 
-        # Handle Validity Dates
-        if has_valid_from:
-            val = row[valid_from_col]
-            if pd.notna(val):
-                # Handle pandas Timestamp or string format
-                if isinstance(val, str):
-                    kwargs["valid_from"] = datetime.fromisoformat(val)
-                elif hasattr(val, "to_pydatetime"):
-                    kwargs["valid_from"] = val.to_pydatetime()
-                elif isinstance(val, datetime):
-                    kwargs["valid_from"] = val
-
-        if has_valid_to:
-            val = row[valid_to_col]
-            if pd.notna(val):
-                if isinstance(val, str):
-                    kwargs["valid_to"] = datetime.fromisoformat(val)
-                elif hasattr(val, "to_pydatetime"):
-                    kwargs["valid_to"] = val.to_pydatetime()
-                elif isinstance(val, datetime):
-                    kwargs["valid_to"] = val
+        # Handle Validity Dates (already converted per distinct value)
+        if valid_from is not None:
+            kwargs["valid_from"] = valid_from
+        if valid_to is not None:
+            kwargs["valid_to"] = valid_to
 
         multi_value_maps.append(MultiValueMap(**kwargs))
 
@@ -505,7 +555,7 @@ def build_multi_representation_map(
 
     # Validate data types (String check)
     for col in _source_cols + _target_cols:
-        if not df[col].dropna().apply(lambda x: isinstance(x, str)).all():
+        if not _all_strings(df[col], allow_missing=True):
             raise TypeError(f"Column '{col}' contains non-string values.")
 
     # Build list of maps (Using the new target_cols signature)
@@ -600,7 +650,7 @@ def build_single_component_map(
     for col in [source_col, target_col]:
         if col not in df.columns:
             raise ValueError(f"Missing required column: {col}")
-        if not df[col].map(lambda x: isinstance(x, str) or pd.isna(x)).all():
+        if not _all_strings(df[col], allow_missing=True):
             raise TypeError(f"Column '{col}' must contain only string values or NaN.")
 
     # Build RepresentationMap using the provided helper
@@ -853,31 +903,35 @@ def build_structure_map(
 # endregion
 
 # region create_schema_from_table()
+# numpy/pandas dtype.kind -> SDMX DataType; anything else is treated as STRING
+_DTYPE_KIND_TO_SDMX = {
+    "i": DataType.INTEGER,
+    "u": DataType.INTEGER,
+    "f": DataType.DOUBLE,
+    "b": DataType.BOOLEAN,
+    "M": DataType.DATE_TIME,
+}
+
 @typechecked
 def _infer_sdmx_type(dtype: object) -> DataType:
     """Infer the SDMX DataType from a pandas/numpy dtype.
 
     Args:
-        dtype (object): The pandas/numpy data type.
+        dtype (object): The pandas/numpy data type, or its name (e.g. "int64").
 
     Returns:
         DataType: The corresponding SDMX DataType.
     """
-    dtype_str = str(dtype)
-
-    if "int" in dtype_str:
-        return DataType.INTEGER
-    elif "float" in dtype_str:
-        return DataType.DOUBLE
-    elif "bool" in dtype_str:
-        return DataType.BOOLEAN
-    elif "datetime" in dtype_str:
-        return DataType.DATE_TIME
-    else:
+    try:
+        kind = pd.api.types.pandas_dtype(dtype).kind
+    except TypeError:
         return DataType.STRING
+    return _DTYPE_KIND_TO_SDMX.get(kind, DataType.STRING)
 
 
-@typechecked
+# characters outside the SDMX Common ID pattern [A-Za-z0-9_@$-]
+_INVALID_ID_CHARS = re.compile(r"[^A-Z0-9_@$-]")
+
 def _sanitize_sdmx_id(value: Any) -> str:
     """Sanitize a string to create a valid SDMX Identifier.
 
@@ -897,8 +951,7 @@ def _sanitize_sdmx_id(value: Any) -> str:
     s = str(value).strip().upper()
     
     # Replace invalid characters with underscore
-    # SDMX Common ID pattern: [A-Za-z0-9_@$-]+
-    s = re.sub(r"[^A-Z0-9_@$-]", "_", s)
+    s = _INVALID_ID_CHARS.sub("_", s)
     
     # Ensure it doesn't start with a number or invalid char if that's a strict requirement,
     # though strictly the NCName pattern allows some flexibility. 
@@ -909,10 +962,14 @@ def _sanitize_sdmx_id(value: Any) -> str:
     return s
 
 
+@lru_cache(maxsize=1024)
 @typechecked
 def _create_concept(concept_id: str, dtype: DataType) -> Concept:
     """Create a simple SDMX Concept with a specific ID and data type.
 
+    Concepts are immutable, so identical (id, dtype) pairs share one cached
+    instance across schema builds.
+
     Args:
         concept_id (str): The unique identifier for the concept.
         dtype (DataType): The data type of the concept.
@@ -946,15 +1003,17 @@ def _create_codelist_from_series(
     Returns:
         Codelist: A Codelist object populated with Codes.
     """
-    unique_values = series.dropna().unique()
-    codes: list[Code] = []
-    
-    for val in sorted(unique_values, key=lambda x: str(x)):
-        # Generate a safe ID for the code
-        code_id = _sanitize_sdmx_id(val)
-        # Use the original value as the name
-        code_name = str(val)
-        codes.append(Code(id=code_id, name=code_name))
+    # Deduplicate first and drop missing values from the (small) set of uniques,
+    # rather than copying the whole column with dropna().
+    unique_values = series.unique()
+    unique_values = unique_values[pd.notna(unique_values)]
+
+    # Stringify each distinct value once; the string is both the sort key
+    # and the code name, so it need not be recomputed per use.
+    code_names = sorted(str(val) for val in unique_values)
+    codes: list[Code] = [
+        Code(id=_sanitize_sdmx_id(name), name=name) for name in code_names
+    ]
 
     # Generate a Codelist ID, typically prefixed with CL_
     codelist_id = f"CL_{_sanitize_sdmx_id(col_name)}"
@@ -1095,7 +1154,8 @@ def create_schema_from_table(
 
     # Validate that all columns exist in the dataframe
     all_required_cols = dimensions + [measure] + [time_dimension] + attributes
-    missing_cols = [col for col in all_required_cols if col not in dataframe.columns]
+    available_cols = set(dataframe.columns)
+    missing_cols = [col for col in all_required_cols if col not in available_cols]
     
     if missing_cols:
         #logger.error("Missing columns in dataframe: %s", missing_cols)
@@ -1103,10 +1163,13 @@ def create_schema_from_table(
 
     component_list: list[Component] = []
 
+    # Resolve all column dtypes once instead of materialising a Series per lookup
+    dtypes = dataframe.dtypes
+
     # 1. Process Dimensions (with Codelist inference)
     for col in dimensions:
         # Determine strict type
-        dtype = _infer_sdmx_type(dataframe[col].dtype)
+        dtype = _infer_sdmx_type(dtypes[col])
         
         # Create Concept
         concept = _create_concept(col, dtype)
@@ -1131,7 +1194,7 @@ def create_schema_from_table(
     component_list.append(time_comp)
 
     # 3. Process Measure (Single, Uncoded)
-    meas_dtype = _infer_sdmx_type(dataframe[measure].dtype)
+    meas_dtype = _infer_sdmx_type(dtypes[measure])
     meas_concept = _create_concept(measure, meas_dtype)
     meas_comp = _create_component(
         measure, 
@@ -1145,7 +1208,7 @@ def create_schema_from_table(
     # For this implementation, we will infer Codelists for attributes if they appear to be categorical (string)
     # However, to be safe and robust, we often allow attributes to be coded if they are strings.
     for col in attributes:
-        dtype = _infer_sdmx_type(dataframe[col].dtype)
+        dtype = _infer_sdmx_type(dtypes[col])
         concept = _create_concept(col, dtype)
         
         # Heuristic: If string type, create a Codelist. 
@@ -1285,11 +1348,12 @@ def _parse_comp_mapping_sheet(sheets: dict[str, pd.DataFrame], sheet_name: str =
     # Extract only the relevant columns to ignore potential artifacts (e.g., 'Unnamed: X')
     result_df = df[expected_columns]
 
-    # Remove rows where ALL columns are NaN/None (empty rows)
+    # Remove rows where ALL columns are NaN/None (empty rows) with a boolean mask
+    # rather than an in-place dropna on the column slice.
     # We do not use how='any' because some mapping rules might have an empty SOURCE
-    result_df.dropna(how="all", inplace=True)
+    non_empty = result_df.notna().to_numpy().any(axis=1)
 
-    return result_df
+    return result_df.loc[non_empty]
 
 @typechecked
 def _parse_rep_mapping_sheet(
@@ -1300,7 +1364,7 @@ def _parse_rep_mapping_sheet(
 
     The function expects column headers to be prefixed with "S:" for source columns and 
     "T:" for target columns. Columns without these prefixes are ignored. The prefixes 
-    are removed in the output DataFrames.
+    are removed and surrounding whitespace is stripped in the output DataFrames.
 
     Args:
         sheets (dict[str, pd.DataFrame]): Dictionary containing DataFrames.
@@ -1331,9 +1395,10 @@ def _parse_rep_mapping_sheet(
     source_df = df[source_cols]
     target_df = df[target_cols]
 
-    # Rename columns by removing the first 2 characters ("S:" and "T:")
-    source_df.columns = [col[2:] for col in source_cols]
-    target_df.columns = [col[2:] for col in target_cols]
+    # Rename columns by removing the first 2 characters ("S:" and "T:"). Headers are
+    # stripped here once, so every rule resolving a column sees clean names.
+    source_df.columns = [col[2:].strip() for col in source_cols]
+    target_df.columns = [col[2:].strip() for col in target_cols]
 
     return {"source": source_df, "target": target_df}
 
@@ -1395,6 +1460,18 @@ def _extract_artefact_id(
 
     return artefact_id
 
+@lru_cache(maxsize=256)
+def _normalized_column_map(columns: Tuple[str, ...]) -> Dict[str, str]:
+    """Map normalized column names (no spaces/underscores, lower case) to the original names.
+
+    The first column wins when two names normalize to the same key. The result is
+    cached and shared between callers, so it must be treated as read-only.
+    """
+    normalized: Dict[str, str] = {}
+    for col in columns:
+        normalized.setdefault(col.replace(" ", "").replace("_", "").lower(), col)
+    return normalized
+
 @typechecked
 def _match_column_name(target_name: str, available_columns: List[str]) -> str:
     """Matches a business name from COMP_MAPPING to the cleaned column names in REP_MAPPING.
@@ -1415,11 +1492,11 @@ def _match_column_name(target_name: str, available_columns: List[str]) -> str:
     if target_name in available_columns:
         return target_name
 
-    # 2. Normalized match (ignore case, spaces, underscores)
+    # 2. Normalized match (ignore case, spaces, underscores), first column in order.
+    # The normalized names are cached per column set, so repeated rules reuse them.
     norm_target = target_name.replace(" ", "").replace("_", "").lower()
-    
-    for col in available_columns:
-        norm_col = col.replace(" ", "").replace("_", "").lower()
+
+    for norm_col, col in _normalized_column_map(tuple(available_columns)).items():
         # Check for containment (e.g., 'Series' in 'SeriesCode')
         if norm_col == norm_target or norm_col in norm_target or norm_target in norm_col:
             return col
@@ -1497,20 +1574,33 @@ def build_structure_map_from_template_wb(
     # 2. Parse Component Mappings Rules
     comp_df = _parse_comp_mapping_sheet(mappings)
 
-    # 3. Prepare Representation Data
-    rep_data: Dict[str, pd.DataFrame] = {}
-    try:
-        rep_data = _parse_rep_mapping_sheet(mappings)
-    except ValueError:
-        # Ignore invalid REP_MAPPING; validation will fail only if used.
-        pass
+    # 3. Representation Data is parsed on the first representation rule, so
+    #    templates with only fixed/implicit rules never touch REP_MAPPING.
+    rep_data: Optional[Dict[str, pd.DataFrame]] = None
 
     generated_maps: List[Union[FixedValueMap, ImplicitComponentMap, ComponentMap]] = []
 
+    # Arguments shared by every representation-based ComponentMap
+    rep_map_kwargs = {
+        "agency": current_agency,
+        "version": current_version,
+        "source_col": "source",
+        "target_col": "target",
+    }
+
     # 4. Generate structure map elements
-    for _, row in comp_df.iterrows():
+    # Normalize the three rule columns with whole-column string ops (same result as
+    # str(value).strip() per cell), then iterate plain tuples instead of Series rows.
+    rule_cols = comp_df[["SOURCE", "TARGET", "MAPPING_RULES"]].astype(str)
+    rule_cols = rule_cols.apply(lambda col: col.str.strip())
+
+    # Drop rows the parser would skip (empty TARGET or missing-ish rule) up front
+    actionable = rule_cols["TARGET"].ne("") & ~rule_cols["MAPPING_RULES"].str.lower().isin(_MISSING_RULE_TOKENS)
+    rule_cols = rule_cols[actionable]
+
+    for source, target, rule in rule_cols.itertuples(index=False, name=None):
         try:
-            parsed = _extract_mapping_rule(row)
+            parsed = _parse_mapping_rule(source, target, rule)
             mapping_rule = parsed["mapping_rule"]
             source_id = parsed["source_id"] or ""   # normalize to str
             target_id = parsed["target_id"] or ""   # normalize to str
@@ -1526,7 +1616,13 @@ def build_structure_map_from_template_wb(
                 generated_maps.append(build_implicit_component_map(source_id, target_id))
 
             elif mapping_rule == "representation":
-                
+                if rep_data is None:
+                    try:
+                        rep_data = _parse_rep_mapping_sheet(mappings)
+                    except ValueError:
+                        # Invalid REP_MAPPING; reported by _extract_representation_map below.
+                        rep_data = {}
+
                 rep_mapping_df = _extract_representation_map(
                         rep_data=rep_data,
                         source_id=source_id,
@@ -1538,12 +1634,9 @@ def build_structure_map_from_template_wb(
                     df=rep_mapping_df,
                     source_component=source_id,
                     target_component=target_id,
-                    agency=current_agency,
                     id=f"MAP_{target_id}",
                     name=f"Mapping for {target_id}",
-                    source_col="source",
-                    target_col="target",
-                    version=current_version
+                    **rep_map_kwargs
                 )
                 generated_maps.append(comp_map)
 
@@ -1553,8 +1646,7 @@ def build_structure_map_from_template_wb(
 
         except ValueError as e:
             # Keep your contextual error wrapping
-            target_for_msg = str(row.get("TARGET", "")).strip()
-            raise ValueError(f"Error processing mapping for Target '{target_for_msg}': {str(e)}") from e
+            raise ValueError(f"Error processing mapping for Target '{target}': {str(e)}") from e
 
     # 5. Construct Final Object
     name_suffix = artefact_ref if artefact_ref else structure_map_id
@@ -1608,23 +1700,21 @@ def _extract_all_artefact_ids(info_df: pd.DataFrame) -> Dict[str, str]:
     # Define structure types to look for
     structure_types = {"dataflow", "datastructure", "provisionagreement"}
 
-    # Normalize keys for case-insensitive matching
-    info_df["Key"] = info_df["Key"].astype(str).str.strip().str.lower()
-
-    # Filter rows matching structure types
-    filtered_df = info_df[info_df["Key"].isin(structure_types)]
-
-    if filtered_df.empty:
-        raise ValueError("No artefact keys found in info_df.")
-
+    # Single pass over (Key, Value) pairs; keys are matched case-insensitively
+    # without rewriting the caller's DataFrame.
     artefact_dict: Dict[str, str] = {}
-    for _, row in filtered_df.iterrows():
-        raw_value = row["Value"]
+    found_key = False
+    for raw_key, raw_value in zip(info_df["Key"].astype(str), info_df["Value"]):
+        key = raw_key.strip().lower()
+        if key not in structure_types:
+            continue
+        found_key = True
         if pd.isna(raw_value) or str(raw_value).strip() == "":
             continue
-        # Extract ID from 'Agency:ID(Version)' format
-        value_str = str(raw_value).strip()
-        artefact_dict[row["Key"]] = value_str
+        artefact_dict[key] = str(raw_value).strip()
+
+    if not found_key:
+        raise ValueError("No artefact keys found in info_df.")
 
     if not artefact_dict:
         raise ValueError("Artefact keys found but all values are empty or invalid.")
@@ -1665,9 +1755,10 @@ def _extract_metadata_from_info_sheet(
     artefact_ref: Optional[str] = None
 
     try:
-        # Extract artefacts; the helper lower-cases info_df["Key"] in place
+        # Extract artefacts (keys are matched case-insensitively)
         artefact_dict: Dict[str, str] = _extract_all_artefact_ids(info_df)
-    except Exception:
+    except (KeyError, ValueError):
+        # Empty INFO sheet, missing Key/Value columns, or no artefact keys
         artefact_dict = {}
 
     # Preferred artefact by requested structure_type, otherwise fallback order
@@ -1687,9 +1778,9 @@ def _extract_metadata_from_info_sheet(
                 current_agency = parsed_agency
             if parsed_version:
                 current_version = parsed_version
-        except Exception:
-            # Keep defaults if parsing fails
-            pass 
+        except ValueError:
+            # Keep defaults if the reference is not 'agency:id(version)'
+            pass
 
     return current_agency, current_version, artefact_ref
 
@@ -1702,7 +1793,19 @@ def _is_missing_token(s: str) -> bool:
 
 @typechecked
 def _extract_mapping_rule(row: "pd.Series") -> Dict[str, Optional[str]]:
-    """Parse a COMP_MAPPING row and return a dict of mapping rules. This function performs *syntax-level* validation only and never touches external data.
+    """Parse a COMP_MAPPING row and return a dict of mapping rules.
+
+    Thin wrapper around `_parse_mapping_rule` for callers holding a row as a Series;
+    each cell is normalized with str(...).strip() first.
+    """
+    return _parse_mapping_rule(
+        str(row.get("SOURCE", "")).strip(),
+        str(row.get("TARGET", "")).strip(),
+        str(row.get("MAPPING_RULES", "")).strip(),
+    )
+
+def _parse_mapping_rule(source_id: str, target_id: str, raw_rule: str) -> Dict[str, Optional[str]]:
+    """Parse the normalized (str, stripped) SOURCE, TARGET and MAPPING_RULES cells of a COMP_MAPPING row. This function performs *syntax-level* validation only and never touches external data.
 
     Returns a dict with the following keys:
       - mapping_rule: one of {"skip", "fixed", "implicit", "representation"}
@@ -1715,12 +1818,12 @@ def _extract_mapping_rule(row: "pd.Series") -> Dict[str, Optional[str]]:
                     or for implicit/representation if SOURCE is missing,
                     or for unknown rule strings.
     """
-    source_id = str(row.get("SOURCE", "")).strip()
-    target_id = str(row.get("TARGET", "")).strip()
-    raw_rule  = str(row.get("MAPPING_RULES", "")).strip()
+    # Lowercase once; raw_rule is already stripped, so this also serves the
+    # missing-token check without going through _is_missing_token.
+    rule_lower = raw_rule.lower()
 
     # Skip when TARGET is empty or rule is missing-ish
-    if not target_id or _is_missing_token(raw_rule):
+    if not target_id or rule_lower in _MISSING_RULE_TOKENS:
         return {
             "mapping_rule": "skip",
             "source_id": source_id,
@@ -1728,8 +1831,6 @@ def _extract_mapping_rule(row: "pd.Series") -> Dict[str, Optional[str]]:
             "fixed_value": None,
         }
 
-    rule_lower = raw_rule.lower()
-
     # fixed:<VALUE>
     if rule_lower.startswith("fixed:"):
         parts = raw_rule.split(":", 1)
@@ -1824,13 +1925,23 @@ def _extract_representation_map(
     actual_source_col = _match_column_name(source_id, source_df.columns.tolist())
     actual_target_col = _match_column_name(target_id, target_df.columns.tolist())
 
-    # 3) Build, sanitize, and deduplicate pairs
-    rep_mapping_df = pd.DataFrame({
+    # 3) Align the columns on their index and drop incomplete pairs, then
+    #    deduplicate on integer codes: each pair gets one combined code.
+    aligned = pd.DataFrame({
         "source": source_df[actual_source_col],
         "target": target_df[actual_target_col],
-    }).dropna(subset=["source", "target"], how="any").drop_duplicates()
+    }).dropna(subset=["source", "target"], how="any")
+    source_codes, _ = pd.factorize(aligned["source"])
+    target_codes, target_uniques = pd.factorize(aligned["target"])
+    pair_codes = source_codes * len(target_uniques) + target_codes
+
+    # First occurrence of each pair, kept in original row order
+    _, first_rows = np.unique(pair_codes, return_index=True)
+
+    # 4) Build the final small DataFrame once
+    rep_mapping_df = aligned.iloc[np.sort(first_rows)]
 
-    # 4) Enforce non-empty result
+    # 5) Enforce non-empty result
     if rep_mapping_df.empty:
         raise ValueError(
             f"No valid mapping rows found between source column '{actual_source_col}' "
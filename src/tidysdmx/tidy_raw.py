@@ -1,6 +1,7 @@
 from typing import Dict, List, Any
 from typeguard import typechecked
 from .utils import *
+import numpy as np
 import pandas as pd
 import pysdmx as px
 
@@ -24,17 +25,32 @@ def filter_rows(
     if not codelist_ids:
         return df.copy()
 
-    rows_to_drop = pd.Series(False, index=df.index)
+    # Accumulate into a plain boolean ndarray; OR-ing index-aligned Series
+    # goes through pandas' alignment machinery for every column.
+    rows_to_drop = np.zeros(len(df), dtype=bool)
 
     for col, allowed in codelist_ids.items():
         if col not in df.columns:
             continue
         allowed_str = set(map(str, allowed))
-        col_as_str = df[col].astype(str)
-        unselected_mask = ~col_as_str.isin(allowed_str) & df[col].notna()
-        rows_to_drop |= unselected_mask
+        # Factorize once: only the distinct values are stringified and checked,
+        # and missing values come back as code -1 (never dropped).
+        values = df[col]
+        codes, uniques = pd.factorize(values)
+        if pd.api.types.infer_dtype(uniques, skipna=False) not in ("string", "empty") and \
+                pd.api.types.infer_dtype(values, skipna=True).startswith("mixed"):
+            # factorize merges 1, 1.0 and True although they stringify differently,
+            # so mixed columns are stringified before factorizing.
+            codes, uniques = pd.factorize(values.astype(str))
+            codes[values.isna().to_numpy()] = -1
+        # A trailing True is picked up by code -1, so missing values are kept
+        # (and an all-missing column has something to index into).
+        unique_allowed = np.append(pd.Index(uniques).astype(str).isin(allowed_str), True)
+        rows_to_drop |= ~unique_allowed[codes]
 
-    return df.loc[~rows_to_drop].copy()
+    # take() always materialises new data and, unlike iloc, does not flag the
+    # result as a potential view, so no defensive .copy() is needed on top.
+    return df.take(np.flatnonzero(~rows_to_drop))
 
 @typechecked
 def filter_tidy_raw(
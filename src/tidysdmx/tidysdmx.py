@@ -184,13 +184,13 @@ def parse_dsd_id(dsd_id):
 		stacklevel=2,
 	)
 
-	try:
-		agency, rest = dsd_id.split(":", 1)
-		id_part, version_part = rest.split("(", 1)
-		version = version_part.rstrip(")")
-		return agency, id_part, version
-	except Exception:
-		raise ValueError("Invalid dsd_id format. Expected format: 'agency:id(version)'")
+	# partition returns a fixed 3-tuple, avoiding the intermediate split lists
+	if isinstance(dsd_id, str):
+		agency, colon, rest = dsd_id.partition(":")
+		id_part, paren, version_part = rest.partition("(")
+		if colon and paren:
+			return agency, id_part, version_part.rstrip(")")
+	raise ValueError("Invalid dsd_id format. Expected format: 'agency:id(version)'")
 	
 
 def parse_artefact_id(artefact_id: str) -> tuple[str, str, str]:
@@ -206,13 +206,13 @@ def parse_artefact_id(artefact_id: str) -> tuple[str, str, str]:
 		ValueError: If the artefact_id is not in the expected format.
 	"""
 
-	try:
-		agency, rest = artefact_id.split(":", 1)
-		id_part, version_part = rest.split("(", 1)
-		version = version_part.rstrip(")")
-		return agency, id_part, version
-	except Exception:
-		raise ValueError("Invalid artefact_id format. Expected format: 'agency:id(version)'")
+	# partition returns a fixed 3-tuple, avoiding the intermediate split lists
+	if isinstance(artefact_id, str):
+		agency, colon, rest = artefact_id.partition(":")
+		id_part, paren, version_part = rest.partition("(")
+		if colon and paren:
+			return agency, id_part, version_part.rstrip(")")
+	raise ValueError("Invalid artefact_id format. Expected format: 'agency:id(version)'")
 	
 def standardize_sdmx(
 		data: pd.DataFrame, 
@@ -2,7 +2,6 @@ from typing import Dict, List, Sequence, AbstractSet, Union
 from typeguard import typechecked
 from pathlib import Path
 from openpyxl import Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
 from pathlib import Path
 from dateutil.parser import parse as parse_date
 import pysdmx as px
@@ -34,18 +33,25 @@ def extract_validation_info(schema: px.model.dataflow.Schema) -> Dict[str, objec
             - codelist_ids: Dictionary with coded components as keys and list of codelist IDs as values.
             - dim_comp: List of dimension component names.
     """
-    comp = schema.components
-    # Precompute reusable objects
-    valid_comp = [c.id for c in comp]
-    mandatory_comp = [c.id for c in comp if comp[c.id].required]
-    coded_comp = [c.id for c in comp if comp[c.id].local_codes is not None]
-    dim_comp = [c.id for c in comp if comp[c.id].role == px.model.Role.DIMENSION]
+    # Single pass over the components. Indexing Components by id is a linear
+    # scan, so use each component directly rather than comp[c.id].
+    valid_comp, mandatory_comp, coded_comp, dim_comp = [], [], [], []
+    codelist_ids = {}
+    for c in schema.components:
+        valid_comp.append(c.id)
+        if c.required:
+            mandatory_comp.append(c.id)
+        if c.local_codes is not None:
+            coded_comp.append(c.id)
+            codelist_ids[c.id] = [code.id for code in c.local_codes.items]
+        if c.role == px.model.Role.DIMENSION:
+            dim_comp.append(c.id)
 
     out = {
         "valid_comp": valid_comp,
         "mandatory_comp": mandatory_comp,
         "coded_comp": coded_comp,
-        "codelist_ids": get_codelist_ids(comp, coded_comp),
+        "codelist_ids": codelist_ids,
         "dim_comp": dim_comp,
     }
 
@@ -241,12 +247,6 @@ def build_excel_workbook(
     
     # Leverage helper function
     mapping_rules: list[str] = create_mapping_rules(components, rep_map_set)
-    
-    comp_mapping_df = pd.DataFrame({
-        "source": [""] * len(components),
-        "target": components,
-        "mapping_rules": mapping_rules
-    })
 
     # 2. Create and Populate Workbook
     wb = Workbook()
@@ -255,21 +255,20 @@ def build_excel_workbook(
     default_sheet = wb.active
     default_sheet.title = "comp_mapping"
 
-    # Write the header and data rows
-    for row in dataframe_to_rows(comp_mapping_df, index=False, header=True):
-        default_sheet.append(row)
+    # Write the header and data rows straight from the lists; no DataFrame needed
+    default_sheet.append(["source", "target", "mapping_rules"])
+    for target, rule in zip(components, mapping_rules):
+        default_sheet.append(["", target, rule])
 
     # b. Create optional sheets for representation maps
     if rep_map_set:
         REP_MAP_HEADERS = ["source", "target", "valid_from", "valid_to"]
-        df_rep = pd.DataFrame(columns=REP_MAP_HEADERS)
 
         for tab_name in rep_map_set:
             try:
                 ws = wb.create_sheet(title=tab_name)
-                # Write header row only for the empty DataFrame
-                for row in dataframe_to_rows(df_rep, index=False, header=True):
-                    ws.append(row)
+                # Write header row only
+                ws.append(REP_MAP_HEADERS)
             except Exception as e:
                  # Openpyxl raises ValueError/KeyError for invalid or duplicate names.
                  raise RuntimeError(
@@ -163,9 +163,14 @@ def validate_duplicates(df, dim_comp):
 	Raises:
 		ValueError: If duplicate rows are found for the given combination of columns.
 	"""
-	# Check for duplicates
-	duplicates = df.duplicated(subset=dim_comp, keep=False)
-	if duplicates.any():
+	# Cheap uniqueness probe first; the full keep=False mask is only needed
+	# to report the offending rows when the check fails.
+	if len(dim_comp) == 1:
+		has_duplicates = not df[dim_comp[0]].is_unique
+	else:
+		has_duplicates = df.duplicated(subset=dim_comp).any()
+	if has_duplicates:
+		duplicates = df.duplicated(subset=dim_comp, keep=False)
 		duplicate_rows = df[duplicates]
 		raise ValueError(f"Duplicate rows found:\n{duplicate_rows}")
 
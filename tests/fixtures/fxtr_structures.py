@@ -18,26 +18,20 @@ CACHE_DIR = Path(__file__).parent / "data/structures"
 CACHE_DIR.mkdir(exist_ok=True)
 
 @pytest.fixture(scope="session")
-def value_map_df_mandatory_cols():
+def value_map_df_mandatory_cols(tmp_path_factory):
     """Session-scoped fixture returning a DataFrame with mandatory 'source' and 'target' columns.
 
-    Caches the data to CSV on first run and reloads it on subsequent runs.
+    Writes the data to a CSV under pytest's temporary directory and reads it back.
     """
-    cache_file = CACHE_DIR / "value_map_df_mandatory_cols.csv"
-
-    if cache_file.exists():
-        # Load cached response
-        df = pd.read_csv(cache_file)
-        assert {"source", "target"}.issubset(df.columns)
+    cache_file = tmp_path_factory.mktemp("structures") / "value_map_df_mandatory_cols.csv"
 
-    else:
-        df = pd.DataFrame({
+    pd.DataFrame({
         "source": ["regex:^A", "UY", "FR"],
         "target": ["ARG", "URY", "FRA"]
-        })
-    
-        # Cache as CSV
-        df.to_csv(cache_file, index=False)
+    }).to_csv(cache_file, index=False)
+
+    df = pd.read_csv(cache_file)
+    assert {"source", "target"}.issubset(df.columns)
 
     return df
 
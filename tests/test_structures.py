@@ -51,8 +51,9 @@ from tidysdmx.structures import (
     _extract_metadata_from_info_sheet,
     _extract_mapping_rule,
     _is_missing_token,
-    _extract_representation_map
-
+    _all_strings,
+    _extract_representation_map,
+    _infer_sdmx_type
     )
 
 # region fixtures
@@ -374,6 +375,12 @@ class TestBuildValueMapList:  # noqa: D101
         assert result[0].source == "BR"
         assert result[0].target == "BRA"
 
+    def test_build_value_map_list_missing_source_value(self):
+        """Missing values in source or target are not strings and should raise TypeError."""
+        df = pd.DataFrame({"source": ["BR", None], "target": ["BRA", "ARG"]})
+        with pytest.raises(TypeError, match="only string values"):
+            build_value_map_list(df, "source", "target")
+
     def test_build_value_map_list_column_order_irrelevant(self, value_map_df_mandatory_cols):
         """Column order should not affect the result."""
         df_reordered = value_map_df_mandatory_cols[["target", "source"]]
@@ -1129,6 +1136,35 @@ class TestCreateSchemaFromTable:  # noqa: D101
             create_schema_from_table(df, dimensions=[], measure="A", time_dimension="MISSING")
         assert "Columns not found" in str(exc.value)
 
+
+    @pytest.mark.parametrize("series,expected", [
+        (pd.Series([1, 2], dtype="int64"), DataType.INTEGER),
+        (pd.Series([1, None], dtype="Int64"), DataType.INTEGER),
+        (pd.Series([1.5, None], dtype="Float64"), DataType.DOUBLE),
+        (pd.Series([True, False]), DataType.BOOLEAN),
+        (pd.to_datetime(pd.Series(["2020-01-01"])), DataType.DATE_TIME),
+        (pd.Series(["A", "B"]), DataType.STRING),
+        (pd.Series(["A", "B"], dtype="category"), DataType.STRING),
+    ])
+    def test_create_schema_measure_dtype(self, series, expected) -> None:
+        """Test that measure concepts get their SDMX type from the column dtype, including nullable dtypes."""
+        df = pd.DataFrame({"FREQ": ["A"] * len(series), "TIME_PERIOD": ["2020"] * len(series), "OBS": series})
+        schema = create_schema_from_table(df, dimensions=["FREQ"], time_dimension="TIME_PERIOD", measure="OBS")
+        assert schema.components["OBS"].concept.dtype == expected
+
+    @pytest.mark.parametrize("dtype,expected", [
+        ("int64", DataType.INTEGER),
+        ("float64", DataType.DOUBLE),
+        ("bool", DataType.BOOLEAN),
+        ("datetime64[ns]", DataType.DATE_TIME),
+        ("object", DataType.STRING),
+        ("not_a_dtype", DataType.STRING),
+        (["unhashable"], DataType.STRING),
+    ])
+    def test_infer_sdmx_type_accepts_dtype_names(self, dtype, expected) -> None:
+        """Test that dtypes given by name map like the dtype objects, and unknown input falls back to STRING."""
+        assert _infer_sdmx_type(dtype) == expected
+
 class TestBuildSchemaFromWbTemplate:  # noqa: D101
     def test_parse_info_sheet_basic_scenario(self):
         """Test a standard scenario where the sheet contains simple Key-Value pairs.
@@ -1376,6 +1412,17 @@ class TestBuildSchemaFromWbTemplate:  # noqa: D101
         assert target_df.iloc[1]["Unit"] == "EUR"
 
 
+    def test_parse_rep_mapping_strips_headers(self):
+        """Test that whitespace around the header after the prefix is removed."""
+        df = pd.DataFrame({"S: Series code ": ["A"], "T:  Indicator": ["IND_A"]})
+        sheets = {"REP_MAPPING": df}
+
+        result = _parse_rep_mapping_sheet(sheets)
+
+        assert list(result["source"].columns) == ["Series code"]
+        assert list(result["target"].columns) == ["Indicator"]
+
+
     def test_parse_rep_mapping_missing_sheet(self):
         """Test that ValueError is raised if sheet is missing."""
         sheets = {"OTHER": pd.DataFrame()}
@@ -1499,6 +1546,12 @@ class TestMatchColumnName: #noqa: D101
         result = _match_column_name(target, self.AVAILABLE_COLUMNS)
         assert result == expected
 
+    def test_match_column_name_first_column_in_order_wins(self):
+        """Tests that the first column equal to or containing the target wins, as before caching."""
+        target = "series"
+        result = _match_column_name(target, ["Series code", "SERIES"])
+        assert result == "Series code"
+
     def test_match_column_name_no_match(self):
         """Tests the failure case where no matching column is found."""
         target = "Totally Different Name"
@@ -1820,6 +1873,16 @@ class TestExtractAllArtefactIds: #noqa: D101
         assert result == {'dataflow': 'AGENCY:DF1(1.0)', 'datastructure': 'AGENCY:DSD1(1.0)'}
         assert isinstance(result, dict)
 
+    def test_extract_all_artefact_ids_case_insensitive_keys_input_unchanged(self):
+        """Test keys are matched case-insensitively without modifying the input DataFrame."""
+        df = pd.DataFrame({
+            'Key': [' DataFlow ', 'FMR_AGENCY'],
+            'Value': ['AGENCY:DF1(1.0)', 'AGENCY']
+        })
+        result = _extract_all_artefact_ids(df)
+        assert result == {'dataflow': 'AGENCY:DF1(1.0)'}
+        assert df['Key'].tolist() == [' DataFlow ', 'FMR_AGENCY']
+
     def test_extract_all_artefact_ids_empty_df(self):
         """Test empty DataFrame raises ValueError."""
         df = pd.DataFrame(columns=['Key', 'Value'])
@@ -1902,6 +1965,18 @@ class TestExtractMetadataFromInfoSheet:
         assert version == "1.0"
         assert artefact_ref is None
 
+    def test_unparseable_artefact_ref_keeps_defaults(self):
+        """Tests that a reference not in 'agency:id(version)' form leaves agency and version at their defaults."""
+        info_df = pd.DataFrame({"Key": ["datastructure"], "Value": ["NOT_A_REFERENCE"]})
+        agency, version, artefact_ref = _extract_metadata_from_info_sheet(
+            info_df,
+            agency = "SDMX",
+            version = "1.0",
+            structure_type = "datastructure")
+        assert agency == "SDMX"
+        assert version == "1.0"
+        assert artefact_ref == "NOT_A_REFERENCE"
+
     def test_invalid_structure_type_still_falls_back(self, info_df_with_all):
         """Tests that invalid structure_type raises TypeCheckError."""
         with pytest.raises(TypeCheckError):
@@ -2045,3 +2120,45 @@ class TestExtractRepresentationMap:
         result_df = _extract_representation_map(rep_data, "src_col", "tgt_col")
         assert len(result_df) == 1
         assert result_df.iloc[0].to_dict() == {"source": "A", "target": "X"}
+
+    def test_first_occurrence_kept_in_row_order(self):
+        """Tests that incomplete pairs are dropped and the first of each duplicate pair is kept with its row label."""
+        source_df = pd.DataFrame({"src_col": ["B", None, "B", "A", "B", "A"]})
+        target_df = pd.DataFrame({"tgt_col": ["X", "Y", None, "Z", "X", "Y"]})
+        rep_data = {"source": source_df, "target": target_df}
+
+        result_df = _extract_representation_map(rep_data, "src_col", "tgt_col")
+        expected = pd.DataFrame({"source": ["B", "A", "A"], "target": ["X", "Z", "Y"]}, index=[0, 3, 5])
+        pd.testing.assert_frame_equal(result_df, expected)
+
+    def test_source_and_target_aligned_on_index(self):
+        """Tests that pairs are aligned on row labels, so mismatched indices or lengths leave no NA pairs."""
+        source_df = pd.DataFrame({"src_col": ["A", "B", "C"]}, index=[0, 1, 2])
+        target_df = pd.DataFrame({"tgt_col": ["Y", "Z"]}, index=[1, 2])
+        rep_data = {"source": source_df, "target": target_df}
+
+        result_df = _extract_representation_map(rep_data, "src_col", "tgt_col")
+        expected = pd.DataFrame({"source": ["B", "C"], "target": ["Y", "Z"]}, index=[1, 2])
+        pd.testing.assert_frame_equal(result_df, expected)
+
+
+class TestAllStrings:
+    """Tests for the `_all_strings` helper used to validate mapping columns."""
+
+    @pytest.mark.parametrize("values,dtype,allow_missing,expected", [
+        (["A", "B"], object, False, True),
+        (["A", None], object, False, False),
+        (["A", None], object, True, True),
+        (["A", np.nan], object, True, True),
+        (["A", 1], object, True, False),
+        ([np.nan, np.nan], object, True, True),
+        (["A", "B"], "category", False, True),
+        (["A", None], "category", True, True),
+        (["A", None], "string", False, False),
+        (["A", None], "string", True, True),
+        ([1, 2], "int64", False, False),
+    ])
+    def test_all_strings_cases(self, values, dtype, allow_missing, expected):
+        """Matches an element-wise isinstance(x, str) check on the (optionally non-missing) values."""
+        series = pd.Series(values, dtype=dtype)
+        assert _all_strings(series, allow_missing=allow_missing) is expected
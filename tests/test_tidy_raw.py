@@ -122,6 +122,30 @@ class TestFilterRows:
         result = filter_rows(sample_df, {"code": ["1", "2"]})
         assert list(result.index) == [0, 1]
 
+    def test_filter_rows_non_string_allowed_values_are_stringified(self):
+        """Only the first allowed value is type-checked; later ones must still match as strings."""
+        df = pd.DataFrame({"code": ["1", "2", "3"]})
+        result = filter_rows(df, {"code": ["1", 2]})
+        assert list(result.index) == [0, 1]
+
+    @pytest.mark.parametrize(
+        "values, expected_index",
+        [
+            ([1.0, 1, "1", True, None], [1, 2, 4]),
+            ([True, 1], [1]),
+            ([None, None], [0, 1]),
+        ],
+    )
+    def test_filter_rows_mixed_types_compared_as_strings(self, values, expected_index):
+        """Check each value on its own string form.
+
+        Values like 1, 1.0 and True are equal for pandas but stringify differently,
+        and missing values are never dropped.
+        """
+        df = pd.DataFrame({"code": pd.Series(values, dtype=object)})
+        result = filter_rows(df, {"code": ["1"]})
+        assert list(result.index) == expected_index
+
 # endregion
 
 # region Testing filter_tidy_raw()
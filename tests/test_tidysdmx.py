@@ -99,6 +99,12 @@ class TestParseArtefactId:
         except ValueError as e:
             assert str(e) == "Invalid artefact_id format. Expected format: 'agency:id(version)'"
 
+    def test_parse_artefact_id_non_string_input(self):
+        """Non-string input raises ValueError rather than TypeError."""
+        # Test that non-string input raises ValueError
+        with pytest.raises(ValueError, match="Invalid artefact_id format"):
+            parse_artefact_id(["WB:WDI(1.0)"])
+
 class TestStandardizeIndicatorId:
     def test_standardize_indicator_id_basic(self):
         df = pd.DataFrame(
@@ -5,6 +5,7 @@ from pysdmx.model import (
     Components, 
     Codelist, 
     Code, 
+    Concept,
     Role
     )
 from openpyxl import load_workbook
@@ -166,6 +167,32 @@ class TestExtractValidationInfo:
                    if key != "codelist_ids")
         assert isinstance(result["codelist_ids"], dict)
 
+    def test_extract_validation_info_values(self):
+        """Check each key is populated from the matching component attributes."""
+        codelist = Codelist(
+            id="CL_TEST",
+            agency="AGENCY",
+            version="1.0",
+            name="Test Codelist",
+            items=[Code(id="CODE_A"), Code(id="CODE_B")]
+        )
+        components = Components([
+            Component(id="DIM", required=True, role=Role.DIMENSION, concept=Concept("DIM"), local_codes=codelist),
+            Component(id="OBS_VALUE", required=True, role=Role.MEASURE, concept=Concept("OBS_VALUE")),
+            Component(id="ATTR", required=False, role=Role.ATTRIBUTE, concept=Concept("ATTR"), local_codes=codelist, attachment_level="O"),
+        ])
+        schema = Schema(context="datastructure", agency="AGENCY", id="TEST", version="1.0", components=components)
+
+        result = extract_validation_info(schema)
+
+        assert result == {
+            "valid_comp": ["DIM", "OBS_VALUE", "ATTR"],
+            "mandatory_comp": ["DIM", "OBS_VALUE"],
+            "coded_comp": ["DIM", "ATTR"],
+            "codelist_ids": {"DIM": ["CODE_A", "CODE_B"], "ATTR": ["CODE_A", "CODE_B"]},
+            "dim_comp": ["DIM"],
+        }
+
 # region Testing get_codelist_ids()
 class TestGetCodelistIds:
     def test_get_codelist_ids_has_expected_structure(self, ifpri_asti_schema):
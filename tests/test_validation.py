@@ -62,6 +62,13 @@ class TestValidateDuplicates: # noqa: D101
         with pytest.raises(ValueError, match="Duplicate rows found"):
             validate_duplicates(df, dim_columns)
 
+    def test_validate_duplicates_single_column(self):
+        """Test the single-column key path for duplicate and unique columns."""
+        df = pd.DataFrame({"col1": ["A", "B", "A"], "col2": [4, 5, 6]})
+        with pytest.raises(ValueError, match="Duplicate rows found"):
+            validate_duplicates(df, ["col1"])
+        validate_duplicates(df, ["col2"])
+
 class TestValidateCodelistIds: # noqa: D101
     @pytest.mark.skip(reason="Test needs to be modified to use correct inputs")
     def test_validate_codelist_ids_valid():